@@ -33,7 +33,7 @@ from .utils import (
     set_git_credential,
     unset_git_credential,
 )
-from .utils._token import _get_token_from_environment, _get_token_from_google_colab
+from .utils._token import _get_token_from_environment, _get_token_from_google_colab, _invalidate_token_cache
 
 
 logger = logging.get_logger(__name__)
@@ -132,6 +132,7 @@ def logout() -> None:
         Path(constants.HF_TOKEN_PATH).unlink()
     except FileNotFoundError:
         pass
+    _invalidate_token_cache()
 
     # Check if still logged in
     if _get_token_from_google_colab() is not None:
@@ -326,6 +327,7 @@ def _login(token: str, add_to_git_credential: bool, write_permission: bool = Fal
     path = Path(constants.HF_TOKEN_PATH)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(token)
+    _invalidate_token_cache()
     print(f"Your token has been saved to {constants.HF_TOKEN_PATH}")
     print("Login successful")
 
@@ -19,7 +19,7 @@ from pathlib import Path
 from typing import Optional
 
 from .. import constants
-from ._token import get_token
+from ._token import _invalidate_token_cache, get_token
 
 
 class HfFolder:
@@ -43,6 +43,7 @@ class HfFolder:
         """
         cls.path_token.parent.mkdir(parents=True, exist_ok=True)
         cls.path_token.write_text(token)
+        _invalidate_token_cache()
 
     # TODO: deprecate when adapted in transformers/datasets/gradio
     # @_deprecate_method(version="1.0", message="Use `huggingface_hub.get_token` instead.")
@@ -82,6 +83,8 @@ class HfFolder:
         except FileNotFoundError:
             pass
 
+        _invalidate_token_cache()
+
     @classmethod
     def _copy_to_new_path_and_warn(cls):
         if cls._old_path_token.exists() and not cls.path_token.exists():
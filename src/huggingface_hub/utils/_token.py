@@ -15,9 +15,8 @@
 
 import os
 import warnings
-from pathlib import Path
 from threading import Lock
-from typing import Optional
+from typing import Optional, Tuple
 
 from .. import constants
 from ._runtime import is_colab_enterprise, is_google_colab
@@ -27,6 +26,13 @@ _IS_GOOGLE_COLAB_CHECKED = False
 _GOOGLE_COLAB_SECRET_LOCK = Lock()
 _GOOGLE_COLAB_SECRET: Optional[str] = None
 
+# Deletes '\r' and '\n' in a single pass (see `_clean_token`)
+_TOKEN_STRIP_TABLE = str.maketrans("", "", "\r\n")
+
+# Token resolved from environment variables or token file, keyed on the values it depends on.
+_TOKEN_CACHE_LOCK = Lock()
+_TOKEN_CACHE: Optional[Tuple[Tuple, Optional[str]]] = None
+
 
 def get_token() -> Optional[str]:
     """
@@ -42,7 +48,7 @@ def get_token() -> Optional[str]:
     Returns:
         `str` or `None`: The token, `None` if it doesn't exist.
     """
-    return _get_token_from_google_colab() or _get_token_from_environment() or _get_token_from_file()
+    return _get_token_from_google_colab() or _get_token_from_environment_or_file()
 
 
 def _get_token_from_google_colab() -> Optional[str]:
@@ -109,16 +115,71 @@ def _get_token_from_google_colab() -> Optional[str]:
         return _GOOGLE_COLAB_SECRET
 
 
+def _get_token_from_environment_or_file() -> Optional[str]:
+    """Get token from environment variables or token file, memoized for the current process.
+
+    `get_token` is called before every HTTP request. To avoid reading the token file each time, the resolved value is
+    cached and only recomputed if one of the environment variables, the token path or the token file (modification
+    time and size) has changed. In steady state, this costs a single `os.stat`.
+
+    File timestamps can be too coarse to detect a rewrite with a token of the same length. In-process writers must
+    therefore call `_invalidate_token_cache` after updating or deleting the token file.
+    """
+    global _TOKEN_CACHE
+
+    key = (
+        os.environ.get("HF_TOKEN"),
+        os.environ.get("HUGGING_FACE_HUB_TOKEN"),
+        constants.HF_TOKEN_PATH,
+        _get_token_file_signature(),
+    )
+    # Resolve under the lock so that a concurrent invalidation cannot be overwritten by a stale value
+    with _TOKEN_CACHE_LOCK:
+        if _TOKEN_CACHE is not None and _TOKEN_CACHE[0] == key:
+            return _TOKEN_CACHE[1]
+
+        token = _get_token_from_environment() or _get_token_from_file()
+        _TOKEN_CACHE = (key, token)
+        return token
+
+
+def _invalidate_token_cache() -> None:
+    """Clear the token memoized by `_get_token_from_environment_or_file`.
+
+    Must be called after the token file has been written or deleted.
+    """
+    global _TOKEN_CACHE
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE = None
+
+
+def _get_token_file_signature() -> Optional[Tuple[int, int]]:
+    """Return `(mtime_ns, size)` of the token file, or `None` if it cannot be stat'ed."""
+    try:
+        stat = os.stat(constants.HF_TOKEN_PATH)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _get_token_from_environment() -> Optional[str]:
     # `HF_TOKEN` has priority (keep `HUGGING_FACE_HUB_TOKEN` for backward compatibility)
-    return _clean_token(os.environ.get("HF_TOKEN") or os.environ.get("HUGGING_FACE_HUB_TOKEN"))
+    environ = os.environ
+    for name in ("HF_TOKEN", "HUGGING_FACE_HUB_TOKEN"):
+        value = environ.get(name)
+        if value:
+            return _clean_token(value)
+    return None
 
 
 def _get_token_from_file() -> Optional[str]:
+    # Read raw bytes and decode manually (cheaper than `Path.read_text` for such a small file)
     try:
-        return _clean_token(Path(constants.HF_TOKEN_PATH).read_text())
+        with open(constants.HF_TOKEN_PATH, "rb") as f:
+            data = f.read()
     except FileNotFoundError:
         return None
+    return _clean_token(data.decode("utf-8"))
 
 
 def _clean_token(token: Optional[str]) -> Optional[str]:
@@ -128,4 +189,4 @@ def _clean_token(token: Optional[str]) -> Optional[str]:
     """
     if token is None:
         return None
-    return token.replace("\r", "").replace("\n", "").strip() or None
+    return token.translate(_TOKEN_STRIP_TABLE).strip() or None
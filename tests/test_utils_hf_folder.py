@@ -15,6 +15,7 @@
 
 import os
 import unittest
+from unittest.mock import patch
 from uuid import uuid4
 
 from huggingface_hub.utils import HfFolder
@@ -40,7 +41,7 @@ class HfFolderTest(unittest.TestCase):
         self.assertEqual(HfFolder.get_token(), None)
         # test TOKEN in env
         self.assertEqual(HfFolder.get_token(), None)
-        with unittest.mock.patch.dict(os.environ, {"HF_TOKEN": token}):
+        with patch.dict(os.environ, {"HF_TOKEN": token}):
             self.assertEqual(HfFolder.get_token(), token)
 
     def test_token_strip(self):
@@ -51,3 +52,44 @@ class HfFolderTest(unittest.TestCase):
         HfFolder.save_token(" " + token + "\n")
         self.assertEqual(HfFolder.get_token(), token)
         HfFolder.delete_token()
+
+    def test_token_cache_invalidated_on_update(self):
+        """
+        Test the memoized token is refreshed when the token file or the environment changes.
+        """
+        token_1 = _generate_token()
+        token_2 = _generate_token() + "-updated"
+        HfFolder.save_token(token_1)
+        self.assertEqual(HfFolder.get_token(), token_1)
+        self.assertEqual(HfFolder.get_token(), token_1)  # cached
+
+        HfFolder.save_token(token_2)
+        self.assertEqual(HfFolder.get_token(), token_2)
+
+        with patch.dict(os.environ, {"HF_TOKEN": token_1}):
+            self.assertEqual(HfFolder.get_token(), token_1)
+        self.assertEqual(HfFolder.get_token(), token_2)
+
+        HfFolder.delete_token()
+        self.assertEqual(HfFolder.get_token(), None)
+
+    def test_token_cache_invalidated_on_same_size_update(self):
+        """
+        Test a token of the same length is picked up even if the file timestamp did not change.
+
+        Simulates filesystems with coarse timestamps (FAT, HFS+, some network mounts).
+        """
+        token_1 = _generate_token()
+        token_2 = _generate_token()
+        self.assertEqual(len(token_1), len(token_2))
+
+        HfFolder.save_token(token_1)
+        self.assertEqual(HfFolder.get_token(), token_1)
+        stat = os.stat(HfFolder.path_token)
+
+        HfFolder.save_token(token_2)
+        os.utime(HfFolder.path_token, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(HfFolder.get_token(), token_2)
+
+        HfFolder.delete_token()
+        self.assertEqual(HfFolder.get_token(), None)
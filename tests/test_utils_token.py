@@ -0,0 +1,62 @@
+"""Contain tests for the memoized `get_token` helper."""
+
+import os
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+from huggingface_hub import constants
+from huggingface_hub._login import _login, logout
+from huggingface_hub.utils._token import get_token
+
+
+def _generate_token() -> str:
+    return f"hf_{uuid4().hex}"
+
+
+class TestGetTokenCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.path = Path(constants.HF_TOKEN_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def tearDown(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def test_external_write_is_detected(self) -> None:
+        """A token file rewritten by another process (no invalidation) is picked up from its stat signature."""
+        token_1 = _generate_token()
+        token_2 = _generate_token() + "_other_length"
+
+        self.path.write_text(token_1)
+        self.assertEqual(get_token(), token_1)
+
+        self.path.write_text(token_2)
+        self.assertEqual(get_token(), token_2)
+
+        self.path.unlink()
+        self.assertIsNone(get_token())
+
+    @patch("huggingface_hub.hf_api.get_token_permission", return_value="read")
+    def test_login_invalidates_cache(self, mock_get_token_permission) -> None:
+        token_1 = _generate_token()
+        token_2 = _generate_token()
+        self.assertEqual(len(token_1), len(token_2))
+
+        self.path.write_text(token_1)
+        self.assertEqual(get_token(), token_1)
+
+        # Restore previous timestamps to simulate a filesystem with coarse mtime resolution
+        # Same size and same mtime => only the explicit invalidation can refresh the cache
+        stat = os.stat(self.path)
+        _login(token_2, add_to_git_credential=False)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(get_token(), token_2)
+
+    @patch("huggingface_hub._login.unset_git_credential")
+    def test_logout_invalidates_cache(self, mock_unset_git_credential) -> None:
+        self.path.write_text(_generate_token())
+        self.assertIsNotNone(get_token())
+
+        logout()
+        self.assertIsNone(get_token())
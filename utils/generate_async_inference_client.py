@@ -15,11 +15,10 @@
 """Contains a tool to generate `src/huggingface_hub/inference/_generated/_async_client.py`."""
 
 import argparse
-import os
 import re
-import tempfile
+import subprocess
 from pathlib import Path
-from typing import NoReturn
+from typing import List, NoReturn
 
 from ruff.__main__ import find_ruff_bin
 
@@ -29,6 +28,9 @@ ASYNC_CLIENT_FILE_PATH = (
 )
 SYNC_CLIENT_FILE_PATH = Path(__file__).parents[1] / "src" / "huggingface_hub" / "inference" / "_client.py"
 
+# Resolved once: `find_ruff_bin` scans the install paths on each call
+RUFF_BIN = find_ruff_bin()
+
 
 def generate_async_client_code(code: str) -> str:
     """Generate AsyncInferenceClient source code."""
@@ -78,14 +80,23 @@ def generate_async_client_code(code: str) -> str:
 
 
 def format_source_code(code: str) -> str:
-    """Apply formatter on a generated source code."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "async_client.py"
-        filepath.write_text(code)
-        ruff_bin = find_ruff_bin()
-        os.spawnv(os.P_WAIT, ruff_bin, ["ruff", "check", str(filepath), "--fix", "--quiet"])
-        os.spawnv(os.P_WAIT, ruff_bin, ["ruff", "format", str(filepath), "--quiet"])
-        return filepath.read_text()
+    """Apply formatter on a generated source code.
+
+    Code is piped to `ruff check --fix` then `ruff format` through stdin/stdout (no temporary file).
+    """
+    code = _run_ruff(RUFF_BIN, ["check", "--fix", "--exit-zero"], code)
+    return _run_ruff(RUFF_BIN, ["format"], code)
+
+
+def _run_ruff(ruff_bin: str, args: List[str], code: str) -> str:
+    # Only stdout is captured: ruff's diagnostics and errors are still printed to the terminal
+    return subprocess.run(
+        [ruff_bin, *args, "--quiet", "--stdin-filename", str(ASYNC_CLIENT_FILE_PATH.resolve()), "-"],
+        input=code,
+        stdout=subprocess.PIPE,
+        check=True,
+        encoding="utf-8",
+    ).stdout
 
 
 def check_async_client(update: bool) -> NoReturn:
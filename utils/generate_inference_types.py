@@ -15,9 +15,8 @@
 """Contains a tool to generate `src/huggingface_hub/inference/_generated/types`."""
 
 import argparse
-import os
 import re
-import tempfile
+import subprocess
 from pathlib import Path
 from typing import Dict, List, Literal, NoReturn
 
@@ -35,6 +34,9 @@ REFERENCE_PACKAGE_KO_PATH = (
     Path(__file__).parents[1] / "docs" / "source" / "ko" / "package_reference" / "inference_types.md"
 )
 
+# Resolved once: `find_ruff_bin` scans the install paths on each call
+RUFF_BIN = find_ruff_bin()
+
 IGNORE_FILES = [
     "__init__.py",
     "base.py",
@@ -227,15 +229,25 @@ def add_dataclasses_to_main_init(content: str, dataclasses: Dict[str, List[str]]
     return MAIN_INIT_PY_REGEX.sub(f'"inference._generated.types": [{dataclasses_str}]', content)
 
 
-def format_source_code(code: str) -> str:
-    """Apply formatter on the generated source code."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        filepath = Path(tmpdir) / "tmp.py"
-        filepath.write_text(code)
-        ruff_bin = find_ruff_bin()
-        os.spawnv(os.P_WAIT, ruff_bin, ["ruff", "check", str(filepath), "--fix", "--quiet"])
-        os.spawnv(os.P_WAIT, ruff_bin, ["ruff", "format", str(filepath), "--quiet"])
-        return filepath.read_text()
+def format_source_code(code: str, filepath: Path) -> str:
+    """Apply formatter on the generated source code.
+
+    Code is piped to `ruff check --fix` then `ruff format` through stdin/stdout (no temporary file). `filepath` is the
+    file the code will be written to. It is only used by ruff to resolve the repository configuration.
+    """
+    code = _run_ruff(RUFF_BIN, ["check", "--fix", "--exit-zero"], code, filepath)
+    return _run_ruff(RUFF_BIN, ["format"], code, filepath)
+
+
+def _run_ruff(ruff_bin: str, args: List[str], code: str, filepath: Path) -> str:
+    # Only stdout is captured: ruff's diagnostics and errors are still printed to the terminal
+    return subprocess.run(
+        [ruff_bin, *args, "--quiet", "--stdin-filename", str(filepath.resolve()), "-"],
+        input=code,
+        stdout=subprocess.PIPE,
+        check=True,
+        encoding="utf-8",
+    ).stdout
 
 
 def generate_reference_package(dataclasses: Dict[str, List[str]], language: Literal["en", "ko"]) -> str:
@@ -271,20 +283,20 @@ def check_inference_types(update: bool) -> NoReturn:
         content = file.read_text()
 
         fixed_content = fix_inference_classes(content, module_name=file.stem)
-        formatted_content = format_source_code(fixed_content)
+        formatted_content = format_source_code(fixed_content, file)
 
         dataclasses[file.stem] = _list_dataclasses(formatted_content)
 
         check_and_update_file_content(file, formatted_content, update)
 
     init_py_content = create_init_py(dataclasses)
-    init_py_content = format_source_code(init_py_content)
     init_py_file = INFERENCE_TYPES_FOLDER_PATH / "__init__.py"
+    init_py_content = format_source_code(init_py_content, init_py_file)
     check_and_update_file_content(init_py_file, init_py_content, update)
 
     main_init_py_content = MAIN_INIT_PY_FILE.read_text()
     updated_main_init_py_content = add_dataclasses_to_main_init(main_init_py_content, dataclasses)
-    updated_main_init_py_content = format_source_code(updated_main_init_py_content)
+    updated_main_init_py_content = format_source_code(updated_main_init_py_content, MAIN_INIT_PY_FILE)
     check_and_update_file_content(MAIN_INIT_PY_FILE, updated_main_init_py_content, update)
 
     reference_package_content_en = generate_reference_package(dataclasses, "en")